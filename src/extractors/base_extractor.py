@@ -3,23 +3,113 @@ Base Extractor Class for Agentic Pattern Extraction
 Provides common functionality for all framework-specific extractors
 """
 import json
+import logging
 import yaml
-import uuid
+import os
+import secrets
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Prefer the libyaml-backed loader, fall back to pure Python if unavailable
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# orjson is optional; it parses straight from bytes and is faster on dict-heavy input
+_json_loads = orjson.loads if orjson else json.loads
+
+# One parser is reused across calls; every subtree is copied out before
+# _json_loads_keys returns, so no document outlives the next parse
+_simdjson_parser = simdjson.Parser() if simdjson else None
+
+# simdjson only beats a full parse on large files with unused content
+SIMDJSON_MIN_BYTES = 64 * 1024
+
+
+def _json_loads_keys(data: bytes, keys) -> Dict:
+    """
+    Parse JSON and materialize only the given top-level keys
+
+    For large files with pysimdjson installed the document stays on the
+    parser's tape and only the requested subtrees become Python objects.
+    Small files, and anything simdjson rejects (e.g. integers wider than
+    64 bits), get a full parse with the keys picked out.
+    """
+    if simdjson is not None and len(data) >= SIMDJSON_MIN_BYTES:
+        try:
+            return _simdjson_pick(data, keys)
+        except (RuntimeError, ValueError):
+            pass
+
+    doc = _json_loads(data)
+    return {key: doc[key] for key in keys if key in doc}
+
+
+def _simdjson_pick(data: bytes, keys) -> Dict:
+    """Materialize the given top-level keys from a simdjson document"""
+    doc = _simdjson_parser.parse(data)
+    picked = {}
+    for key in keys:
+        if key not in doc:
+            continue
+        value = doc[key]
+        if isinstance(value, simdjson.Object):
+            value = value.as_dict()
+        elif isinstance(value, simdjson.Array):
+            value = value.as_list()
+        picked[key] = value
+    return picked
+
+
+def _yaml_load(stream) -> Any:
+    """Load YAML with the loader chosen above (CSafeLoader, else SafeLoader)"""
+    return yaml.load(stream, Loader=Loader)
+
+# Fields every normalized pattern must have, in the order they are reported
+_REQUIRED_FIELDS = ("id", "framework", "agents", "tasks", "workflow_pattern")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+logger = logging.getLogger(__name__)
+
+# Below this many files process_files runs serially instead of starting a pool
+PARALLEL_MIN_FILES = 32
+
+
+def _process_chunk(extractor: "BaseExtractor", paths: List[Path], validate: bool) -> List[Tuple[Path, Optional[Dict[str, Any]]]]:
+    """Run process_file over one chunk of paths inside a worker process"""
+    return [(path, extractor.process_file(path, validate=validate)) for path in paths]
 
 
 class BaseExtractor(ABC):
     """Abstract base class for framework-specific extractors"""
 
+    _yaml_load = staticmethod(_yaml_load)
+
+    # File suffix -> loader method name (looked up on self so subclasses can override)
+    _LOADERS = {
+        '.json': '_load_json',
+        '.yaml': '_load_yaml',
+        '.yml': '_load_yaml',
+        '.py': '_load_python',
+    }
+
     def __init__(self, framework_name: str):
         self.framework_name = framework_name
 
     def make_id(self, prefix: str = "pat") -> str:
         """Generate unique ID for entities"""
-        return f"{prefix}_{uuid.uuid4().hex[:8]}"
+        return f"{prefix}_{secrets.token_hex(4)}"
 
     def get_readable_filename(self, source_file: Path) -> str:
         """Generate readable filename: framework_sourcename"""
@@ -27,34 +117,30 @@ class BaseExtractor(ABC):
         return f"{self.framework_name}_{source_stem}"
 
     def now_iso(self) -> str:
-        """Get current timestamp in ISO format"""
-        return datetime.utcnow().isoformat() + "Z"
+        """Get current UTC timestamp in ISO format (always with microseconds)"""
+        return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
 
     def load_file(self, file_path: Path) -> Any:
         """Load file based on extension"""
-        if file_path.suffix.lower() == '.json':
-            return self._load_json(file_path)
-        elif file_path.suffix.lower() in ['.yaml', '.yml']:
-            return self._load_yaml(file_path)
-        elif file_path.suffix.lower() == '.py':
-            return self._load_python(file_path)
-        else:
+        loader = self._LOADERS.get(file_path.suffix.lower())
+        if loader is None:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        return getattr(self, loader)(file_path)
 
-    def _load_json(self, file_path: Path) -> Dict:
-        """Load JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _load_json(self, file_path: Path, keys: Optional[List[str]] = None) -> Dict:
+        """Load JSON file, optionally keeping only the given top-level keys"""
+        data = file_path.read_bytes()
+        if keys is not None:
+            return _json_loads_keys(data, keys)
+        return _json_loads(data)
 
     def _load_yaml(self, file_path: Path) -> Dict:
         """Load YAML file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return self._yaml_load(file_path.read_bytes())
 
     def _load_python(self, file_path: Path) -> str:
         """Load Python file as text"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return file_path.read_bytes().decode('utf-8')
 
     @abstractmethod
     def extract(self, file_path: Path) -> Dict[str, Any]:
@@ -144,16 +230,19 @@ class BaseExtractor(ABC):
         }
         """
         pattern_id = self.make_id("pattern")
+        timestamp = self.now_iso()  # created_at and extraction_date share one timestamp
+        source_str = str(source_file)
+        framework = self.framework_name
 
         normalized = {
             "id": pattern_id,
             "readable_name": self.get_readable_filename(source_file),
-            "framework": self.framework_name,
-            "source_file": str(source_file),
-            "title": raw_data.get("title", f"{self.framework_name} pattern {pattern_id}"),
+            "framework": framework,
+            "source_file": source_str,
+            "title": raw_data["title"] if "title" in raw_data else f"{framework} pattern {pattern_id}",
             "description": raw_data.get("description", ""),
             "objective": raw_data.get("objective", ""),
-            "created_at": self.now_iso(),
+            "created_at": timestamp,
             "agents": self._normalize_agents(raw_data.get("agents", [])),
             "tasks": self._normalize_tasks(raw_data.get("tasks", [])),
             "tools": self._normalize_tools(raw_data.get("tools", [])),
@@ -161,8 +250,8 @@ class BaseExtractor(ABC):
             "workflow_pattern": self._normalize_workflow(raw_data.get("workflow", {})),
             "team": self._normalize_team(raw_data.get("team", {})),
             "provenance": {
-                "extracted_from": str(source_file),
-                "extraction_date": self.now_iso(),
+                "extracted_from": source_str,
+                "extraction_date": timestamp,
                 "extractor_version": "1.0.0"
             }
         }
@@ -172,65 +261,125 @@ class BaseExtractor(ABC):
 
         return normalized
 
+    def normalize_soa(self, raw_data: Dict[str, Any], source_file: Path) -> Dict[str, Any]:
+        """
+        Normalize extracted data to a column-oriented (struct-of-arrays) layout
+
+        Same content as normalize(), but each entity field is a flat list so
+        aggregations across many patterns scan lists instead of nested dicts.
+        Agent tools are flattened into agent_tools with agent_tool_owners
+        holding the index of the owning agent in agent_ids.
+        """
+        return self._to_soa(self.normalize(raw_data, source_file))
+
+    @staticmethod
+    def _to_soa(pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a normalized pattern into column lists"""
+        agents = pattern["agents"]
+        tasks = pattern["tasks"]
+        tools = pattern["tools"]
+        resources = pattern["resources"]
+
+        agent_tools = []
+        agent_tool_owners = []
+        for i, agent in enumerate(agents):
+            tools_used = agent["tools"] or ()  # "tools": None survives normalize()
+            agent_tools.extend(tools_used)
+            agent_tool_owners.extend([i] * len(tools_used))
+
+        return {
+            "id": pattern["id"],
+            "framework": pattern["framework"],
+            "source_file": pattern["source_file"],
+            "agent_ids": [a["id"] for a in agents],
+            "agent_names": [a["name"] for a in agents],
+            "agent_roles": [a["role"] for a in agents],
+            "agent_language_models": [a["language_model"] for a in agents],
+            "agent_tools": agent_tools,
+            "agent_tool_owners": agent_tool_owners,
+            "task_ids": [t["id"] for t in tasks],
+            "task_titles": [t["title"] for t in tasks],
+            "task_assigned_agents": [t["assigned_agent"] for t in tasks],
+            "tool_ids": [t["id"] for t in tools],
+            "tool_names": [t["name"] for t in tools],
+            "tool_types": [t["type"] for t in tools],
+            "resource_ids": [r["id"] for r in resources],
+            "resource_names": [r["name"] for r in resources],
+            "resource_types": [r["type"] for r in resources],
+            "workflow_type": pattern["workflow_pattern"]["type"]
+        }
+
     def _normalize_agents(self, agents: List[Dict]) -> List[Dict]:
         """Normalize agent data"""
-        normalized_agents = []
-        for agent in agents:
-            agent_id = self.make_id("agent")
-            normalized_agents.append({
-                "id": agent_id,
-                "name": agent.get("name", agent.get("role", "Agent")),
-                "role": agent.get("role", ""),
-                "description": agent.get("description", ""),
-                "goal": agent.get("goal", ""),
-                "backstory": agent.get("backstory", ""),
-                "tasks": agent.get("tasks", []),  # Will be populated later
-                "tools": agent.get("tools", []),
-                "language_model": agent.get("llm", agent.get("model", agent.get("language_model"))),
-                "memory": agent.get("memory", False),
-                "humanInputMode": agent.get("humanInputMode")
-            })
+        make_id = self.make_id
+        normalized_agents = [None] * len(agents)
+        for i, agent in enumerate(agents):
+            g = agent.get
+            # Fallbacks are only looked up when the preferred key is missing
+            if "llm" in agent:
+                language_model = agent["llm"]
+            elif "model" in agent:
+                language_model = agent["model"]
+            else:
+                language_model = g("language_model")
+
+            normalized_agents[i] = {
+                "id": make_id("agent"),
+                "name": agent["name"] if "name" in agent else g("role", "Agent"),
+                "role": g("role", ""),
+                "description": g("description", ""),
+                "goal": g("goal", ""),
+                "backstory": g("backstory", ""),
+                "tasks": g("tasks", []),  # Will be populated later
+                "tools": g("tools", []),
+                "language_model": language_model,
+                "memory": g("memory", False),
+                "humanInputMode": g("humanInputMode")
+            }
         return normalized_agents
 
     def _normalize_tasks(self, tasks: List[Dict]) -> List[Dict]:
         """Normalize task data"""
-        normalized_tasks = []
-        for task in tasks:
-            task_id = self.make_id("task")
-            normalized_tasks.append({
-                "id": task_id,
-                "title": task.get("title", task.get("description", "Task")[:50]),
-                "description": task.get("description", ""),
-                "expected_output": task.get("expected_output", ""),
-                "assigned_agent": task.get("agent", "")  # Will be linked later
-            })
+        make_id = self.make_id
+        normalized_tasks = [None] * len(tasks)
+        for i, task in enumerate(tasks):
+            g = task.get
+            normalized_tasks[i] = {
+                "id": make_id("task"),
+                "title": task["title"] if "title" in task else g("description", "Task")[:50],
+                "description": g("description", ""),
+                "expected_output": g("expected_output", ""),
+                "assigned_agent": g("agent", "")  # Will be linked later
+            }
         return normalized_tasks
 
     def _normalize_tools(self, tools: List[Dict]) -> List[Dict]:
         """Normalize tool data"""
-        normalized_tools = []
-        for tool in tools:
-            tool_id = self.make_id("tool")
-            normalized_tools.append({
-                "id": tool_id,
-                "name": tool.get("name", "Tool"),
-                "description": tool.get("description", ""),
-                "type": tool.get("type", ""),
-                "resource": tool.get("resource", "")
-            })
+        make_id = self.make_id
+        normalized_tools = [None] * len(tools)
+        for i, tool in enumerate(tools):
+            g = tool.get
+            normalized_tools[i] = {
+                "id": make_id("tool"),
+                "name": g("name", "Tool"),
+                "description": g("description", ""),
+                "type": g("type", ""),
+                "resource": g("resource", "")
+            }
         return normalized_tools
 
     def _normalize_resources(self, resources: List[Dict]) -> List[Dict]:
         """Normalize resource data"""
-        normalized_resources = []
-        for resource in resources:
-            resource_id = self.make_id("resource")
-            normalized_resources.append({
-                "id": resource_id,
-                "name": resource.get("name", "Resource"),
-                "type": resource.get("type", ""),
-                "description": resource.get("description", "")
-            })
+        make_id = self.make_id
+        normalized_resources = [None] * len(resources)
+        for i, resource in enumerate(resources):
+            g = resource.get
+            normalized_resources[i] = {
+                "id": make_id("resource"),
+                "name": g("name", "Resource"),
+                "type": g("type", ""),
+                "description": g("description", "")
+            }
         return normalized_resources
 
     def _normalize_workflow(self, workflow: Dict) -> Dict:
@@ -258,21 +407,22 @@ class BaseExtractor(ABC):
         Validate extracted pattern against schema
         Returns True if valid, raises ValueError if invalid
         """
-        required_fields = ["id", "framework", "agents", "tasks", "workflow_pattern"]
-
-        for field in required_fields:
-            if field not in pattern:
-                raise ValueError(f"Missing required field: {field}")
+        missing = _REQUIRED_FIELD_SET - pattern.keys()
+        if missing:
+            field = next(f for f in _REQUIRED_FIELDS if f in missing)
+            raise ValueError(f"Missing required field: {field}")
 
         if not pattern["agents"]:
             raise ValueError("Pattern must have at least one agent")
 
         return True
 
-    def process_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def process_file(self, file_path: Path, *, validate: bool = True) -> Optional[Dict[str, Any]]:
         """
         Complete pipeline: extract, normalize, validate
         Returns normalized pattern or None if error
+
+        Pass validate=False to skip validation for trusted inputs
         """
         try:
             # Extract raw data
@@ -282,10 +432,50 @@ class BaseExtractor(ABC):
             normalized = self.normalize(raw_data, file_path)
 
             # Validate
-            self.validate(normalized)
+            if validate:
+                self.validate(normalized)
 
             return normalized
 
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
+        except Exception:
+            logger.exception("Error processing %s", file_path)
             return None
+
+    def process_files(self, paths: List[Path], workers: Optional[int] = None, *,
+                      validate: bool = True) -> Iterator[Tuple[Path, Optional[Dict[str, Any]]]]:
+        """
+        Run process_file over many files using a process pool
+        Yields (path, normalized pattern or None) as each chunk of files
+        finishes, so results come back in completion order, not input order
+
+        Small batches (or a single worker) run serially, since starting a
+        pool costs more than it saves there
+        """
+        paths = list(paths)
+        if not paths:
+            return
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(paths) < PARALLEL_MIN_FILES:
+            for path in paths:
+                yield path, self.process_file(path, validate=validate)
+            return
+
+        chunksize = max(1, len(paths) // (4 * workers))
+        chunks = [paths[i:i + chunksize] for i in range(0, len(paths), chunksize)]
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(_process_chunk, self, chunk, validate): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception:
+                    # A worker crash only fails the files in its own chunk
+                    chunk = futures[future]
+                    logger.exception("Error processing chunk starting at %s", chunk[0])
+                    results = [(path, None) for path in chunk]
+                yield from results
+        finally:
+            # Don't run queued chunks if the caller stops iterating early
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -43,29 +43,29 @@ def process_all():
         print(f"\n[Processing {framework_name}...]")
 
         # Process all files in framework directory
-        for file_path in framework_dir.rglob("*"):
-            if file_path.suffix in ['.py', '.json', '.yaml', '.yml']:
-                stats["total"] += 1
-
-                try:
-                    # Extract and normalize
-                    normalized = extractor.process_file(file_path)
-
-                    if normalized:
-                        # Save to normalized directory with readable filename
-                        output_file = DATA_NORMALIZED / f"{normalized['readable_name']}.json"
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(normalized, f, indent=2, ensure_ascii=False)
-
-                        stats["success"] += 1
-                        print(f"  OK {file_path.name} -> {normalized['readable_name']}.json")
-                    else:
-                        stats["failed"] += 1
-                        print(f"  FAIL {file_path.name} (extraction failed)")
-
-                except Exception as e:
+        files = [
+            file_path for file_path in framework_dir.rglob("*")
+            if file_path.suffix in ['.py', '.json', '.yaml', '.yml']
+        ]
+        stats["total"] += len(files)
+
+        for file_path, normalized in extractor.process_files(files):
+            try:
+                if normalized:
+                    # Save to normalized directory with readable filename
+                    output_file = DATA_NORMALIZED / f"{normalized['readable_name']}.json"
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        json.dump(normalized, f, indent=2, ensure_ascii=False)
+
+                    stats["success"] += 1
+                    print(f"  OK {file_path.name} -> {normalized['readable_name']}.json")
+                else:
                     stats["failed"] += 1
-                    print(f"  FAIL {file_path.name}: {e}")
+                    print(f"  FAIL {file_path.name} (extraction failed)")
+
+            except Exception as e:
+                stats["failed"] += 1
+                print(f"  FAIL {file_path.name}: {e}")
 
     # Print summary
     print(f"\n{'='*60}")
@@ -16,7 +16,7 @@ class MastraAIExtractor(base_extractor.BaseExtractor):
         """Extract MastraAI pattern from JSON/YAML"""
 
         if file_path.suffix == '.json':
-            data = self._load_json(file_path)
+            data = self._load_json(file_path, keys=["agents", "workflows"])
         elif file_path.suffix in ['.yaml', '.yml']:
             data = self._load_yaml(file_path)
         else:
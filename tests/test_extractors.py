@@ -2,6 +2,7 @@
 Simple Tests for Extractors
 """
 import sys
+import re
 import json
 from pathlib import Path
 
@@ -12,6 +13,14 @@ from crewai_extractor import CrewAIExtractor
 from langraph_extractor import LangGraphExtractor
 from autogen_extractor import AutoGenExtractor
 from mastraai_extractor import MastraAIExtractor
+import base_extractor
+
+
+def _without_volatile(pattern):
+    """Serialize a pattern with random ids and timestamps masked out"""
+    text = json.dumps(pattern, sort_keys=True)
+    text = re.sub(r'(pattern|agent|task|tool|resource)_[0-9a-f]{8}', r'\1_ID', text)
+    return re.sub(r'\d{4}-\d{2}-\d{2}T[\d:.]+Z', 'TIMESTAMP', text)
 
 
 def test_crewai_extractor():
@@ -71,6 +80,113 @@ def test_json_serializable():
         print(f"  ⚠️  Test file not found: {test_file}")
 
 
+def test_process_files():
+    """Test batch processing matches per-file results"""
+    print("Testing batch processing...")
+
+    extractor = MastraAIExtractor()
+    test_dir = Path("../data/raw/mastraai")
+
+    if test_dir.exists():
+        files = sorted(test_dir.glob("*"))
+        expected = {path: _without_volatile(extractor.process_file(path)) for path in files}
+
+        serial = list(extractor.process_files(files, workers=2))
+
+        # Force the process pool even though the sample set is small
+        min_files = base_extractor.PARALLEL_MIN_FILES
+        base_extractor.PARALLEL_MIN_FILES = 0
+        try:
+            pooled = list(extractor.process_files(files, workers=2))
+        finally:
+            base_extractor.PARALLEL_MIN_FILES = min_files
+
+        for results in (serial, pooled):
+            assert sorted(path for path, _ in results) == files
+            for path, result in results:
+                assert result is not None, f"Extraction failed: {path}"
+                assert _without_volatile(result) == expected[path]
+
+        print(f"  ✅ Processed {len(pooled)} files")
+    else:
+        print(f"  ⚠️  Test directory not found: {test_dir}")
+
+
+def test_load_json_keys():
+    """Test key-filtered JSON loading matches a full parse"""
+    print("Testing key-filtered JSON loading...")
+
+    extractor = MastraAIExtractor()
+    test_dir = Path("../data/raw/mastraai")
+
+    if test_dir.exists():
+        keys = ["agents", "workflows"]
+        files = sorted(test_dir.glob("*.json"))
+        simdjson = base_extractor.simdjson
+        min_bytes = base_extractor.SIMDJSON_MIN_BYTES
+
+        # The sample files are small, so drop the size threshold to reach simdjson
+        legs = [("without simdjson", None)]
+        if simdjson is not None:
+            legs.append(("with simdjson", simdjson))
+
+        for _, module in legs:
+            base_extractor.simdjson = module
+            base_extractor.SIMDJSON_MIN_BYTES = 0
+            try:
+                for path in files:
+                    full = json.loads(path.read_text(encoding="utf-8"))
+                    expected = {key: full[key] for key in keys if key in full}
+                    assert extractor._load_json(path, keys=keys) == expected, f"Mismatch: {path}"
+
+                # Integers wider than 64 bits load like a full parse either way
+                data = b'{"agents": [123456789012345678901234567890], "other": 1}'
+                expected = {"agents": base_extractor._json_loads(data)["agents"]}
+                assert base_extractor._json_loads_keys(data, keys) == expected
+            finally:
+                base_extractor.simdjson = simdjson
+                base_extractor.SIMDJSON_MIN_BYTES = min_bytes
+
+        ran = " and ".join(name for name, _ in legs)
+        skipped = "" if simdjson is not None else " (simdjson not installed, skipped)"
+        print(f"  ✅ {len(files)} files match {ran}{skipped}")
+    else:
+        print(f"  ⚠️  Test directory not found: {test_dir}")
+
+
+def test_normalize_soa():
+    """Test column-oriented output lines up with the row-oriented one"""
+    print("Testing SoA output...")
+
+    extractor = CrewAIExtractor()
+    test_file = Path("../data/raw/crewai/example1.py")
+
+    if test_file.exists():
+        raw_data = extractor.extract(test_file)
+        result = extractor.normalize_soa(raw_data, test_file)
+
+        assert result["framework"] == "crewai"
+        assert len(result["agent_ids"]) == len(result["agent_names"]) == len(raw_data["agents"])
+        assert len(result["task_ids"]) == len(result["task_titles"]) == len(raw_data["tasks"])
+
+        # Columns line up with the rows of the same normalized pattern
+        tooled = {"agents": [{"name": "A", "tools": ["a", "b"]}, {"name": "B", "tools": ["c"]}]}
+        pattern = extractor.normalize(tooled, test_file)
+        columns = extractor._to_soa(pattern)
+        assert columns["agent_ids"] == [a["id"] for a in pattern["agents"]]
+        assert columns["agent_names"] == [a["name"] for a in pattern["agents"]]
+        assert columns["agent_tools"] == ["a", "b", "c"]
+        assert columns["agent_tool_owners"] == [0, 0, 1]
+
+        # Agents whose tools are explicitly null contribute no tool rows
+        null_tools = extractor.normalize_soa({"agents": [{"name": "A", "tools": None}]}, test_file)
+        assert null_tools["agent_tools"] == [] and null_tools["agent_tool_owners"] == []
+
+        print(f"  ✅ {len(result['agent_ids'])} agent rows, {len(result['task_ids'])} task rows")
+    else:
+        print(f"  ⚠️  Test file not found: {test_file}")
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n🧪 Running Extractor Tests\n")
@@ -79,7 +195,10 @@ def run_all_tests():
     tests = [
         test_crewai_extractor,
         test_output_format,
-        test_json_serializable
+        test_json_serializable,
+        test_process_files,
+        test_load_json_keys,
+        test_normalize_soa
     ]
 
     passed = 0